@@ -0,0 +1,95 @@
+"""
+Admission control for chat generations — a concurrency limit with a short bounded
+wait queue; anything beyond that is shed immediately with 503 + Retry-After.
+"""
+import asyncio
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class ChatAdmission:
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float, retry_after: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0  # every 503, whether the queue was full or the wait timed out
+        self.queue_timeouts = 0
+        self.deadline_exceeded = 0
+
+    def _reject(self) -> HTTPException:
+        self.rejected += 1
+        return HTTPException(
+            status_code=503,
+            detail="Chat is busy right now — please try again shortly",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    async def acquire(self):
+        if self._slots.locked():
+            if self.queued >= self.max_queue:
+                raise self._reject()
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.queue_timeouts += 1
+                raise self._reject()
+            finally:
+                self.queued -= 1
+        else:
+            await self._slots.acquire()
+        self.in_flight += 1
+        self.admitted += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self._slots.release()
+
+    def record_deadline_exceeded(self):
+        self.deadline_exceeded += 1
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "queue_timeouts": self.queue_timeouts,
+            "deadline_exceeded": self.deadline_exceeded,
+        }
+
+
+class AdmittedStreamingResponse(StreamingResponse):
+    """StreamingResponse that closes its body (cancelling upstream work) and frees its slot when done."""
+
+    def __init__(self, *args, admission: ChatAdmission, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.admission = admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                await self.body_iterator.aclose()
+            finally:
+                self.admission.release()
+
+
+chat_admission = ChatAdmission(
+    max_concurrent=settings.CHAT_MAX_CONCURRENT,
+    max_queue=settings.CHAT_MAX_QUEUE,
+    queue_timeout=settings.CHAT_QUEUE_TIMEOUT_S,
+    retry_after=settings.CHAT_RETRY_AFTER_S,
+)
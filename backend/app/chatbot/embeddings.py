@@ -0,0 +1,97 @@
+"""
+Local CPU embeddings — hashed TF-IDF over word unigrams + bigrams.
+No model download, no network: a query embeds in well under a millisecond.
+"""
+import math
+import re
+from hashlib import blake2b
+from langchain_core.embeddings import Embeddings
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+
+STOPWORDS = frozenset("""
+a about after all also am an and any are as at be been being but by can could did do does
+for from had has have he her him his how i if in into is it its just me my no not of on or
+our she so some than that the their them then there these they this those to up us was we
+were what when where which who whom why will with would you your
+""".split())
+
+
+def _stem(token: str) -> str:
+    """Very light suffix stripping so "databases"/"database" and "deployed"/"deployment" meet."""
+    if not token.isalpha() or len(token) <= 4:
+        return token
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    for suffix in ("ments", "ment", "ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 4:
+            return token[:-len(suffix)]
+    if token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _tokenize(text: str) -> list[str]:
+    tokens = []
+    for t in _TOKEN_RE.findall(text.lower()):
+        t = t.rstrip(".-")
+        tokens.append(t)
+        if "." in t:
+            tokens.append(t.split(".")[0])  # "react.js" also matches "react"
+    kept = [_stem(t) for t in tokens if len(t) > 1 and t not in STOPWORDS]
+    # A stopword-only text ("Who are you?") keeps its raw tokens rather than embedding to nothing
+    return kept or [_stem(t) for t in tokens if t]
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Hashed TF-IDF vectors (sublinear TF, L2-normalised) for cosine search. IDF weights are
+    refit from the corpus on every embed_documents call, i.e. every index rebuild.
+    """
+
+    def __init__(self, dim: int = 4096):
+        self.dim = dim
+        self.idf: dict[int, float] = {}
+
+    def _counts(self, text: str) -> dict[int, int]:
+        tokens = _tokenize(text)
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        counts: dict[int, int] = {}
+        for feature in features:
+            # blake2b, not crc32: crc32 collides outright on real pairs ("react" / "web application")
+            idx = int.from_bytes(blake2b(feature.encode(), digest_size=8).digest(), "little") % self.dim
+            counts[idx] = counts.get(idx, 0) + 1
+        # Never return a zero vector — cosine search rejects it with NaNs
+        return counts or {0: 1}
+
+    def _vector(self, counts: dict[int, int]) -> list[float]:
+        weights = {
+            idx: (1.0 + math.log(tf)) * self.idf.get(idx, 1.0)
+            for idx, tf in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+
+        vec = [0.0] * self.dim
+        for idx, w in weights.items():
+            vec[idx] = w / norm
+        return vec
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        all_counts = [self._counts(t) for t in texts]
+        df: dict[int, int] = {}
+        for counts in all_counts:
+            for idx in counts:
+                df[idx] = df.get(idx, 0) + 1
+        n = len(texts)
+        # Small +0.1 floor: terms in every chunk (like the owner's name) barely count but never zero out
+        self.idf = {idx: math.log((1 + n) / (1 + d)) + 0.1 for idx, d in df.items()}
+        return [self._vector(c) for c in all_counts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._vector(self._counts(text))
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return self.embed_query(text)
@@ -12,8 +12,12 @@ from langchain.chains import ConversationalRetrievalChain
 from langchain.callbacks import AsyncIteratorCallbackHandler
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import PromptTemplate
 from app.config import get_settings
+from app.chatbot.embeddings import HashingEmbeddings
+from app.chatbot.sse import sse_event, coalesce
+from app.chatbot.admission import chat_admission
 
 settings = get_settings()
 
@@ -53,23 +57,30 @@ WHAT AMAN IS LOOKING FOR:
 """
 
 _vector_store: InMemoryVectorStore = None
-_embeddings: OpenAIEmbeddings = None
+_embeddings: Embeddings = None
 
 
-def _get_embeddings() -> OpenAIEmbeddings:
+def _has_openai_key() -> bool:
+    return bool(settings.OPENAI_API_KEY) and "efgh5678" not in settings.OPENAI_API_KEY
+
+
+def _get_embeddings() -> Embeddings:
     global _embeddings
     if _embeddings is None:
-        _embeddings = OpenAIEmbeddings(
-            model="text-embedding-3-small",
-            openai_api_key=settings.OPENAI_API_KEY,
-        )
+        if settings.EMBEDDINGS_BACKEND == "hashing":
+            _embeddings = HashingEmbeddings(dim=settings.EMBEDDINGS_DIM)
+        else:
+            _embeddings = OpenAIEmbeddings(
+                model="text-embedding-3-small",
+                openai_api_key=settings.OPENAI_API_KEY,
+            )
     return _embeddings
 
 
 async def rebuild_index():
     global _vector_store
     
-    if not settings.OPENAI_API_KEY or "efgh5678" in settings.OPENAI_API_KEY:
+    if settings.EMBEDDINGS_BACKEND == "openai" and not _has_openai_key():
         print("⚠️ OPENAI_API_KEY is missing or fake. Skipping RAG index build.")
         return
 
@@ -127,8 +138,8 @@ async def stream_chat_response(
     message: str,
     chat_history: list[tuple[str, str]],
 ) -> AsyncGenerator[str, None]:
-    if not settings.OPENAI_API_KEY or "efgh5678" in settings.OPENAI_API_KEY:
-        yield "data: AI chatbot not configured yet — add your real OpenAI API key!\n\n"
+    if not _has_openai_key():
+        yield sse_event("AI chatbot not configured yet — add your real OpenAI API key!")
         return
 
     vs = get_vector_store()
@@ -138,7 +149,7 @@ async def stream_chat_response(
 
     safe_message = message[:500].strip()
     if not safe_message:
-        yield "data: Please enter a message.\n\n"
+        yield sse_event("Please enter a message.")
         return
 
     callback = AsyncIteratorCallbackHandler()
@@ -161,12 +172,31 @@ async def stream_chat_response(
     task = asyncio.create_task(
         chain.ainvoke({"question": safe_message, "chat_history": chat_history})
     )
-
+    # End the token stream even if the chain fails or is cancelled before the LLM starts
+    task.add_done_callback(lambda _: callback.done.set())
+    deadline = asyncio.get_running_loop().call_later(settings.CHAT_TIMEOUT_S, task.cancel)
+
+    chunks = coalesce(
+        callback.aiter(),
+        max_bytes=settings.CHAT_FLUSH_MAX_BYTES,
+        max_delay=settings.CHAT_FLUSH_MAX_DELAY_MS / 1000,
+    )
     try:
-        async for token in callback.aiter():
-            yield f"data: {token}\n\n"
+        async for chunk in chunks:
+            yield sse_event(chunk)
+        await asyncio.wait({task})
     finally:
+        # Client disconnects close this generator — stop the coalescer's reader task,
+        # its flush timer and the upstream LLM call now rather than at GC time
+        await chunks.aclose()
+        deadline.cancel()
         callback.done.set()
-
-    await task
-    yield "data: [DONE]\n\n"
+        if not task.done():
+            task.cancel()
+
+    if task.cancelled():
+        chat_admission.record_deadline_exceeded()
+        yield sse_event("\n\nSorry, that took too long — please try again.")
+    else:
+        task.result()
+    yield sse_event("[DONE]")
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Request, HTTPException, Depends
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from pydantic import BaseModel
 from app.chatbot.rag import stream_chat_response
+from app.chatbot.admission import chat_admission, AdmittedStreamingResponse
+from app.auth.utils import get_current_admin
 
 limiter = Limiter(key_func=get_remote_address)
 router = APIRouter(prefix="/chat", tags=["Chatbot"])
@@ -23,15 +24,21 @@ async def chat(request: Request, payload: ChatRequest):
     # Convert [[human, ai]] to [(human, ai)]
     history = [(h, a) for h, a in payload.chat_history if len([h, a]) == 2]
 
-    async def event_stream():
-        async for chunk in stream_chat_response(payload.message, history):
-            yield chunk
+    # Raises 503 + Retry-After when saturated; the slot is released when the stream ends
+    await chat_admission.acquire()
 
-    return StreamingResponse(
-        event_stream(),
+    return AdmittedStreamingResponse(
+        stream_chat_response(payload.message, history),
+        admission=chat_admission,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
         },
     )
+
+
+@router.get("/stats")
+async def chat_stats(_=Depends(get_current_admin)):
+    """In-flight generations, queue depth and rejection counts for monitoring."""
+    return chat_admission.stats()
@@ -0,0 +1,73 @@
+"""
+Server-Sent Events helpers — frame encoding and token coalescing for chat streams.
+"""
+import asyncio
+from typing import AsyncGenerator, AsyncIterator
+
+
+def sse_event(data: str) -> str:
+    """Encode one SSE event; every line of a multi-line payload gets its own `data:` field."""
+    lines = data.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "".join(f"data: {line}\n" for line in lines) + "\n"
+
+
+async def coalesce(
+    tokens: AsyncIterator[str],
+    max_bytes: int,
+    max_delay: float,
+) -> AsyncGenerator[str, None]:
+    """
+    Batch tokens into chunks, flushing once `max_bytes` are buffered or `max_delay`
+    seconds have passed since the first buffered token. Either limit <= 0 disables batching.
+    """
+    if max_bytes <= 0 or max_delay <= 0:
+        async for token in tokens:
+            yield token
+        return
+
+    loop = asyncio.get_running_loop()
+    buf: list[str] = []
+    size = 0
+    finished = False
+    wake = loop.create_future()
+    timer = None
+
+    def flush():
+        if not wake.done():
+            wake.set_result(None)
+
+    async def pump():
+        # One reader task per stream; per token this costs an append, never a task or timer
+        nonlocal size, finished, timer
+        try:
+            async for token in tokens:
+                if not buf:
+                    timer = loop.call_later(max_delay, flush)
+                buf.append(token)
+                size += len(token.encode())
+                if size >= max_bytes:
+                    flush()
+        finally:
+            finished = True
+            flush()
+
+    reader = asyncio.create_task(pump())
+    try:
+        while True:
+            await wake
+            wake = loop.create_future()
+            if timer is not None:
+                timer.cancel()
+                timer = None
+            if buf:
+                chunk = "".join(buf)
+                buf.clear()
+                size = 0
+                yield chunk
+            if finished:
+                break
+        await reader  # re-raise upstream errors
+    finally:
+        reader.cancel()
+        if timer is not None:
+            timer.cancel()
@@ -0,0 +1,91 @@
+"""
+Response compression middleware — negotiates brotli or gzip.
+Only complete, single-body responses above a size threshold are compressed; streamed
+bodies (the text/event-stream chat route, file downloads) pass through untouched.
+"""
+import gzip
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+EXCLUDED_CONTENT_TYPES = ("text/event-stream", "application/pdf", "image/")
+
+
+def _negotiate(accept_encoding: str) -> str | None:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+
+    # "*" covers any coding not listed explicitly. Highest q wins; ties go to br (listed first).
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in ("br", "gzip"):
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 1, brotli_quality: int = 1):
+        # Low levels on purpose: compression runs on the event loop, and for JSON bodies of a
+        # few KB level 1 gets most of the size win at a fraction of the CPU of level 6
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or content_type.startswith(EXCLUDED_CONTENT_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Compressible type: caches must key on Accept-Encoding whatever we send
+                    MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                    start_message = message  # held until we see the body
+                return
+
+            body = message.get("body", b"")
+            if encoding is None or message.get("more_body", False) or len(body) < self.minimum_size:
+                # Not accepted, streamed or small: send as-is
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if encoding == "br":
+                body = brotli.compress(body, quality=self.brotli_quality)
+            else:
+                body = gzip.compress(body, compresslevel=self.gzip_level)
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
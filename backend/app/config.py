@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -22,6 +23,21 @@ class Settings(BaseSettings):
     # OpenAI
     OPENAI_API_KEY: str = ""
 
+    # RAG embeddings — "openai" (text-embedding-3-small) or "hashing" (local CPU, offline)
+    EMBEDDINGS_BACKEND: Literal["openai", "hashing"] = "openai"
+    EMBEDDINGS_DIM: int = 4096
+
+    # Chat SSE streaming — tokens are coalesced into one frame per flush (0 disables)
+    CHAT_FLUSH_MAX_BYTES: int = 64
+    CHAT_FLUSH_MAX_DELAY_MS: int = 20
+
+    # Chat admission control — concurrent generations, bounded wait queue, per-request deadline
+    CHAT_MAX_CONCURRENT: int = 8
+    CHAT_MAX_QUEUE: int = 16
+    CHAT_QUEUE_TIMEOUT_S: float = 2.0
+    CHAT_TIMEOUT_S: float = 60.0
+    CHAT_RETRY_AFTER_S: int = 5
+
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000"
 
@@ -29,6 +45,9 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE_MB: int = 5
 
+    # Response compression (brotli/gzip) — bodies smaller than this are sent as-is
+    COMPRESSION_MIN_SIZE: int = 1024
+
     @property
     def allowed_origins_list(self) -> list[str]:
         return [o.strip() for o in self.ALLOWED_ORIGINS.split(",")]
@@ -2,13 +2,14 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.config import get_settings
 from app.database import connect_db, close_db
+from app.compression import CompressionMiddleware
 from app.auth.router import router as auth_router
 from app.projects.router import router as projects_router
 from app.resume.router import router as resume_router
@@ -38,6 +39,7 @@ app = FastAPI(
     description="Production API for Aman Singh's AI Portfolio Platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -55,6 +57,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ── Compression ────────────────────────────────────────────────────────────────
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 # ── Routers ────────────────────────────────────────────────────────────────────
 app.include_router(auth_router)
 app.include_router(projects_router)
@@ -36,3 +36,19 @@ class ProjectOut(BaseModel):
     featured: bool
     order: int
     created_at: datetime
+
+
+class ProjectBulkUpdate(ProjectUpdate):
+    id: str
+
+
+class ProjectBulkRequest(BaseModel):
+    reorder: List[str] = []  # project IDs in display order; sets order = index
+    update: List[ProjectBulkUpdate] = []
+    delete: List[str] = []
+
+
+class ProjectBulkResult(BaseModel):
+    matched: int
+    modified: int
+    deleted: int
@@ -1,9 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse
 from bson import ObjectId
+from pymongo import UpdateOne, DeleteOne, ReturnDocument
 from datetime import datetime
 from app.database import get_db
 from app.auth.utils import get_current_admin
-from app.projects.models import ProjectCreate, ProjectUpdate, ProjectOut
+from app.projects.models import (
+    ProjectCreate, ProjectUpdate, ProjectOut, ProjectBulkRequest, ProjectBulkResult,
+)
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -30,17 +34,19 @@ async def list_projects():
     projects = []
     async for p in cursor:
         projects.append(serialize_project(p))
-    return projects
+    # serialize_project already shapes the output — skip a second ProjectOut validation pass
+    return ORJSONResponse(projects)
 
 
 @router.post("", response_model=ProjectOut, status_code=201)
 async def create_project(payload: ProjectCreate, _=Depends(get_current_admin)):
     db = get_db()
     doc = payload.model_dump()
-    doc["created_at"] = datetime.utcnow()
-    result = await db.projects.insert_one(doc)
-    created = await db.projects.find_one({"_id": result.inserted_id})
-    return serialize_project(created)
+    now = datetime.utcnow()
+    # MongoDB keeps milliseconds only — truncate so this response matches later reads
+    doc["created_at"] = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    await db.projects.insert_one(doc)  # sets doc["_id"]; no read-back needed
+    return ORJSONResponse(serialize_project(doc), status_code=201)
 
 
 @router.put("/{project_id}", response_model=ProjectOut)
@@ -51,11 +57,55 @@ async def update_project(project_id: str, payload: ProjectUpdate, _=Depends(get_
     updates = {k: v for k, v in payload.model_dump().items() if v is not None}
     if not updates:
         raise HTTPException(status_code=400, detail="No fields to update")
-    result = await db.projects.update_one({"_id": ObjectId(project_id)}, {"$set": updates})
-    if result.matched_count == 0:
+    updated = await db.projects.find_one_and_update(
+        {"_id": ObjectId(project_id)},
+        {"$set": updates},
+        return_document=ReturnDocument.AFTER,
+    )
+    if updated is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    updated = await db.projects.find_one({"_id": ObjectId(project_id)})
-    return serialize_project(updated)
+    return ORJSONResponse(serialize_project(updated))
+
+
+@router.post("/bulk", response_model=ProjectBulkResult)
+async def bulk_projects(payload: ProjectBulkRequest, _=Depends(get_current_admin)):
+    """
+    Reorder, batch update and batch delete in one bulk_write. All IDs are checked first
+    (one _id lookup), so an unknown ID rejects the whole batch before anything is written.
+    """
+    ids = payload.reorder + [u.id for u in payload.update] + payload.delete
+    if not ids:
+        raise HTTPException(status_code=400, detail="No operations given")
+    if not all(ObjectId.is_valid(i) for i in ids):
+        raise HTTPException(status_code=400, detail="Invalid project ID")
+
+    ops = [
+        UpdateOne({"_id": ObjectId(pid)}, {"$set": {"order": i}})
+        for i, pid in enumerate(payload.reorder)
+    ]
+    for u in payload.update:
+        updates = {k: v for k, v in u.model_dump(exclude={"id"}).items() if v is not None}
+        if not updates:
+            raise HTTPException(status_code=400, detail=f"No fields to update for {u.id}")
+        ops.append(UpdateOne({"_id": ObjectId(u.id)}, {"$set": updates}))
+    ops.extend(DeleteOne({"_id": ObjectId(pid)}) for pid in payload.delete)
+
+    db = get_db()
+    wanted = {ObjectId(i) for i in ids}
+    found = {p["_id"] async for p in db.projects.find({"_id": {"$in": list(wanted)}}, {"_id": 1})}
+    missing = sorted(str(i) for i in wanted - found)
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Projects not found, nothing was changed: {', '.join(missing)}",
+        )
+
+    result = await db.projects.bulk_write(ops, ordered=True)
+    return {
+        "matched": result.matched_count,
+        "modified": result.modified_count,
+        "deleted": result.deleted_count,
+    }
 
 
 @router.delete("/{project_id}", status_code=204)
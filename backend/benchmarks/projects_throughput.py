@@ -0,0 +1,108 @@
+"""
+Benchmark: GET /projects throughput — stdlib JSON + response_model validation (before)
+vs ORJSONResponse without re-validation (after), plus compressed response sizes.
+Runs in-process over httpx's ASGI transport with an in-memory projects collection (no MongoDB).
+Run from backend/: python -m benchmarks.projects_throughput
+"""
+import asyncio
+import time
+from datetime import datetime
+from bson import ObjectId
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app import database
+from app.main import app
+from app.projects.models import ProjectOut
+from app.projects.router import serialize_project
+
+N_PROJECTS = 30
+REQUESTS = 2000
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *_):
+        return self
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for d in self.docs:
+            yield d
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, *_):
+        return FakeCursor(self.docs)
+
+
+class FakeDB:
+    def __init__(self, docs):
+        self.projects = FakeCollection(docs)
+
+
+def make_docs(n: int) -> list[dict]:
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Project {i}",
+            "description": "Full-stack app with a streaming RAG chatbot, admin dashboard and 3D hero. " * 3,
+            "tech_stack": ["Next.js", "FastAPI", "MongoDB", "LangChain", "Tailwind CSS"],
+            "github_url": f"https://github.com/example/project-{i}",
+            "live_url": f"https://project-{i}.example.com",
+            "image_url": None,
+            "featured": i % 3 == 0,
+            "order": i,
+            "created_at": datetime.utcnow(),
+        }
+        for i in range(n)
+    ]
+
+
+# The /projects route as it was before: default JSONResponse + response_model validation
+before_app = FastAPI(default_response_class=JSONResponse)
+
+
+@before_app.get("/projects", response_model=list[ProjectOut])
+async def list_projects_before():
+    projects = []
+    async for p in database.get_db().projects.find().sort("order", 1):
+        projects.append(serialize_project(p))
+    return projects
+
+
+async def bench(label: str, asgi_app, headers: dict):
+    transport = httpx.ASGITransport(app=asgi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        res = await client.get("/projects", headers=headers)
+        size = len(res.content)  # decoded body
+        wire = int(res.headers.get("content-length", size))
+        t0 = time.perf_counter()
+        for _ in range(REQUESTS):
+            await client.get("/projects", headers=headers)
+        elapsed = time.perf_counter() - t0
+    print(
+        f"{label:<28} {REQUESTS / elapsed:8.0f} req/s  {elapsed / REQUESTS * 1e6:7.0f} µs/req  "
+        f"body={size}B wire={wire}B {res.headers.get('content-encoding', '')}"
+    )
+
+
+async def main():
+    database.db = FakeDB(make_docs(N_PROJECTS))
+    identity = {"accept-encoding": "identity"}
+    await bench("before (json + validation)", before_app, identity)
+    await bench("after (orjson)", app, identity)
+    await bench("after (orjson + gzip)", app, {"accept-encoding": "gzip"})
+    await bench("after (orjson + br)", app, {"accept-encoding": "br, gzip"})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
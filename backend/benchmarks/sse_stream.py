@@ -0,0 +1,93 @@
+"""
+Benchmark: CPU per chat stream and concurrent-stream capacity, per-token vs coalesced SSE frames.
+Simulates LLM token streams (no OpenAI calls); every frame is written + drained over a local
+socket pair, like uvicorn's transport. The "tokens only" row is the simulated-LLM cost that both
+variants share, so framing overhead = cpu/stream minus that baseline.
+Run from backend/: python -m benchmarks.sse_stream
+"""
+import asyncio
+import random
+import socket
+import time
+from app.chatbot.sse import sse_event, coalesce
+
+TOKENS_PER_STREAM = 300
+TOKEN_INTERVAL_S = 0.005  # ~200 tokens/s, a fast gpt-4o-mini stream
+CONCURRENCY_LEVELS = (50, 200, 500)
+WORDS = ["Aman", " builds", " Fast", "API", " and", " Next", ".js", " apps", ",", "\n", " with", " RAG"]
+
+
+async def fake_llm_tokens():
+    for _ in range(TOKENS_PER_STREAM):
+        await asyncio.sleep(TOKEN_INTERVAL_S)
+        yield random.choice(WORDS)
+
+
+def per_token_stream():
+    # The original path: stream_chat_response framed each token by hand...
+    async def stream_chat_response():
+        async for token in fake_llm_tokens():
+            yield f"data: {token}\n\n"
+
+    # ...and the chat router re-yielded it through a pass-through event_stream wrapper
+    async def event_stream():
+        async for chunk in stream_chat_response():
+            yield chunk
+
+    return event_stream()
+
+
+async def coalesced_stream(max_bytes: int, max_delay_ms: int):
+    async for chunk in coalesce(fake_llm_tokens(), max_bytes, max_delay_ms / 1000):
+        yield sse_event(chunk)
+
+
+async def consume(stream) -> int:
+    if stream is None:
+        async for _ in fake_llm_tokens():
+            pass
+        return 0
+
+    a, b = socket.socketpair()
+    _, writer = await asyncio.open_connection(sock=a)
+    reader, _ = await asyncio.open_connection(sock=b)
+
+    async def drain_client():
+        while await reader.read(65536):
+            pass
+
+    client = asyncio.create_task(drain_client())
+    frames = 0
+    async for frame in stream:
+        writer.write(frame.encode())
+        await writer.drain()
+        frames += 1
+    writer.close()
+    await client
+    return frames
+
+
+async def run(label: str, make_stream, concurrency: int):
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    frames = await asyncio.gather(*(consume(make_stream()) for _ in range(concurrency)))
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    # Capacity: streams one fully-busy core could sustain at this per-stream CPU cost
+    ideal_wall = TOKENS_PER_STREAM * TOKEN_INTERVAL_S
+    capacity = concurrency * ideal_wall / cpu if cpu else float("inf")
+    print(
+        f"{label:<20} n={concurrency:<4} frames/stream={sum(frames) / concurrency:6.1f} "
+        f"cpu/stream={cpu / concurrency * 1000:6.2f}ms wall={wall:5.2f}s (ideal {ideal_wall:.2f}s) "
+        f"~capacity={capacity:6.0f} streams/core"
+    )
+
+
+async def main():
+    await run("warm-up", lambda: coalesced_stream(64, 20), 10)
+    for n in CONCURRENCY_LEVELS:
+        await run("tokens only", lambda: None, n)
+        await run("per-token (before)", per_token_stream, n)
+        await run("coalesced 64B/20ms", lambda: coalesced_stream(64, 20), n)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
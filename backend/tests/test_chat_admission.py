@@ -0,0 +1,187 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from app.chatbot import rag
+from app.chatbot.admission import ChatAdmission, AdmittedStreamingResponse
+
+
+def make_admission(**kw) -> ChatAdmission:
+    opts = dict(max_concurrent=1, max_queue=1, queue_timeout=0.05, retry_after=7)
+    opts.update(kw)
+    return ChatAdmission(**opts)
+
+
+def test_queued_request_gets_slot_when_released():
+    async def scenario():
+        adm = make_admission(queue_timeout=1.0)
+        await adm.acquire()
+        waiter = asyncio.create_task(adm.acquire())
+        await asyncio.sleep(0)
+        assert adm.stats()["queued"] == 1
+        adm.release()
+        await waiter
+        assert adm.stats()["in_flight"] == 1
+        assert adm.stats()["admitted"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_rejects_immediately_with_retry_after():
+    async def scenario():
+        adm = make_admission(queue_timeout=1.0)
+        await adm.acquire()
+        waiter = asyncio.create_task(adm.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc:
+            await adm.acquire()
+        assert exc.value.status_code == 503
+        assert exc.value.headers["Retry-After"] == "7"
+        waiter.cancel()
+        return adm.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["rejected"] == 1
+    assert stats["queue_timeouts"] == 0
+
+
+def test_queue_timeout_counts_as_rejection():
+    async def scenario():
+        adm = make_admission()
+        await adm.acquire()
+        with pytest.raises(HTTPException) as exc:
+            await adm.acquire()
+        assert exc.value.status_code == 503
+        return adm.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["rejected"] == 1
+    assert stats["queue_timeouts"] == 1
+    assert stats["queued"] == 0
+
+
+async def _run_response(response, receive):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+    return sent
+
+
+def test_streaming_response_releases_slot_when_finished():
+    async def scenario():
+        adm = make_admission()
+        await adm.acquire()
+
+        async def body():
+            yield "data: hi\n\n"
+
+        async def receive():
+            await asyncio.sleep(10)
+
+        await _run_response(AdmittedStreamingResponse(body(), admission=adm), receive)
+        return adm.stats()
+
+    assert asyncio.run(scenario())["in_flight"] == 0
+
+
+def test_streaming_response_closes_body_and_releases_slot_on_disconnect():
+    closed = []
+
+    async def scenario():
+        adm = make_admission()
+        await adm.acquire()
+
+        async def body():
+            try:
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield "data: tick\n\n"
+            finally:
+                closed.append(True)
+
+        async def receive():
+            await asyncio.sleep(0.05)
+            return {"type": "http.disconnect"}
+
+        await _run_response(AdmittedStreamingResponse(body(), admission=adm), receive)
+        await adm.acquire()  # slot is free again
+        return adm.stats()
+
+    stats = asyncio.run(scenario())
+    assert closed == [True]
+    assert stats["admitted"] == 2
+
+
+class StubRetriever:
+    def as_retriever(self, **_):
+        return None
+
+
+@pytest.fixture
+def stub_chain(monkeypatch):
+    """Replace the LLM chain with one that streams a token every 20 ms for ~2 s."""
+    state = {"cancelled": False}
+
+    class StubLLM:
+        def __init__(self, callbacks, **_):
+            state["callback"] = callbacks[0]
+
+    class StubChain:
+        @classmethod
+        def from_llm(cls, **_):
+            return cls()
+
+        async def ainvoke(self, _):
+            try:
+                for i in range(100):
+                    await state["callback"].on_llm_new_token(f"t{i} ")
+                    await asyncio.sleep(0.02)
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+
+    monkeypatch.setattr(rag, "ChatOpenAI", StubLLM)
+    monkeypatch.setattr(rag, "ConversationalRetrievalChain", StubChain)
+    monkeypatch.setattr(rag, "_vector_store", StubRetriever())
+    monkeypatch.setattr(rag.settings, "OPENAI_API_KEY", "sk-test")
+    return state
+
+
+def test_deadline_cancels_chain_and_is_counted(stub_chain, monkeypatch):
+    adm = make_admission()
+    monkeypatch.setattr(rag, "chat_admission", adm)
+    monkeypatch.setattr(rag.settings, "CHAT_TIMEOUT_S", 0.1)
+
+    async def collect():
+        return [chunk async for chunk in rag.stream_chat_response("hi", [])]
+
+    frames = asyncio.run(collect())
+    assert stub_chain["cancelled"]
+    assert "took too long" in frames[-2]
+    assert frames[-1] == "data: [DONE]\n\n"
+    assert adm.stats()["deadline_exceeded"] == 1
+
+
+def test_client_disconnect_cancels_chain_and_closes_coalescer(stub_chain, monkeypatch):
+    coalescers = []
+
+    def tracking_coalesce(*args, **kwargs):
+        gen = rag_coalesce(*args, **kwargs)
+        coalescers.append(gen)
+        return gen
+
+    rag_coalesce = rag.coalesce
+    monkeypatch.setattr(rag, "coalesce", tracking_coalesce)
+
+    async def disconnect_after_first_frame():
+        stream = rag.stream_chat_response("hi", [])
+        await stream.__anext__()
+        await stream.aclose()
+        closed_on_aclose = coalescers[0].ag_frame is None  # before any GC/finalizer tick
+        await asyncio.sleep(0.01)
+        return closed_on_aclose
+
+    assert asyncio.run(disconnect_after_first_frame())
+    assert stub_chain["cancelled"]
@@ -0,0 +1,80 @@
+import asyncio
+import gzip
+import brotli
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from app.compression import CompressionMiddleware, _negotiate
+
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+
+@app.get("/big")
+async def big():
+    return {"items": ["project"] * 100}
+
+
+@app.get("/small")
+async def small():
+    return {"ok": True}
+
+
+@app.get("/stream")
+async def stream():
+    async def events():
+        yield "data: " + "x" * 500 + "\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def get(path: str, accept_encoding: str) -> httpx.Response:
+    async def go():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Raw bytes: httpx would otherwise transparently decode the body
+            async with client.stream("GET", path, headers={"accept-encoding": accept_encoding}) as res:
+                res.raw_body = b"".join([chunk async for chunk in res.aiter_raw()])
+                return res
+
+    return asyncio.run(go())
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("*", "br"),
+    ("gzip;q=0, *", "br"),
+    ("br;q=0.1, gzip;q=1.0", "gzip"),
+    ("gzip;q=0.5, br;q=0.5", "br"),
+    ("gzip, *;q=0.2", "gzip"),
+    ("br;q=0, gzip;q=0, *", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate(header, expected):
+    assert _negotiate(header) == expected
+
+
+def test_large_json_is_compressed():
+    res = get("/big", "gzip")
+    assert res.headers["content-encoding"] == "gzip"
+    assert b"project" in gzip.decompress(res.raw_body)
+    res = get("/big", "br")
+    assert b"project" in brotli.decompress(res.raw_body)
+
+
+@pytest.mark.parametrize("path, encoding", [("/small", "gzip"), ("/big", "identity")])
+def test_vary_set_even_when_not_compressed(path, encoding):
+    res = get(path, encoding)
+    assert "content-encoding" not in res.headers
+    assert "Accept-Encoding" in res.headers["vary"]
+
+
+def test_event_stream_passes_through():
+    res = get("/stream", "gzip, br")
+    assert "content-encoding" not in res.headers
+    assert "vary" not in res.headers
+    assert res.raw_body.startswith(b"data: xxx")
@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+from app.chatbot import rag
+from app.chatbot.embeddings import HashingEmbeddings
+
+
+@pytest.fixture(scope="module")
+def hashing_store(tmp_path_factory):
+    settings = rag.settings
+    saved = settings.EMBEDDINGS_BACKEND, settings.UPLOAD_DIR, rag._embeddings, rag._vector_store
+    settings.EMBEDDINGS_BACKEND = "hashing"
+    settings.UPLOAD_DIR = str(tmp_path_factory.mktemp("uploads"))  # no resume PDF
+    rag._embeddings = None
+    asyncio.run(rag.rebuild_index())
+    yield rag.get_vector_store()
+    settings.EMBEDDINGS_BACKEND, settings.UPLOAD_DIR, rag._embeddings, rag._vector_store = saved
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("What databases does Aman know?", "TECHNICAL SKILLS"),
+    ("What skills does Aman have?", "TECHNICAL SKILLS"),
+    ("Is he looking for internships?", "WHAT AMAN IS LOOKING FOR"),
+    ("What is the portfolio deployed on?", "Deployment: Vercel"),
+    ("Who is Aman Singh?", "passionate Software Developer"),
+])
+def test_hashing_retrieval_ranks_relevant_chunk_first(hashing_store, query, expected):
+    top = hashing_store.similarity_search(query, k=1)[0]
+    assert expected in top.page_content
+
+
+def test_hashing_scores_are_never_negative(hashing_store):
+    results = hashing_store.similarity_search_with_score("Does he know FastAPI or MongoDB?", k=5)
+    assert all(score >= 0 for _, score in results)
+
+
+@pytest.mark.parametrize("query", ["Who is Aman Singh?", "Who is Aman?", "What does he do?", "Who are you?", "?", ""])
+def test_stopword_only_queries_still_search(hashing_store, query):
+    assert len(hashing_store.similarity_search(query, k=4)) == 4
+    assert len(hashing_store.as_retriever(search_kwargs={"k": 4}).invoke(query)) == 4
+
+
+def test_query_vector_is_never_zero():
+    emb = HashingEmbeddings(dim=64)
+    assert any(emb.embed_query("What is it that he does?"))
+    assert any(emb.embed_query(""))
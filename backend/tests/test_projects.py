@@ -0,0 +1,105 @@
+import asyncio
+import httpx
+import pytest
+from datetime import datetime
+from bson import ObjectId
+from pymongo import UpdateOne, DeleteOne
+from app import database
+from app.auth.utils import get_current_admin
+from app.main import app
+
+
+class BulkResult:
+    def __init__(self, matched: int, deleted: int):
+        self.matched_count = matched
+        self.modified_count = matched
+        self.deleted_count = deleted
+
+
+class FakeProjects:
+    """Just enough of a motor collection: known IDs match, everything else doesn't."""
+
+    def __init__(self, known: set[ObjectId]):
+        self.known = known
+        self.bulk_calls = 0
+
+    async def insert_one(self, doc):
+        doc["_id"] = ObjectId()
+
+    async def find_one_and_update(self, filter, update, return_document):
+        if filter["_id"] not in self.known:
+            return None
+        self.updated = update
+        return {"_id": filter["_id"], "title": "old", "description": "d", **update["$set"]}
+
+    def find(self, filter, projection=None):
+        async def cursor():
+            for _id in filter["_id"]["$in"]:
+                if _id in self.known:
+                    yield {"_id": _id}
+
+        return cursor()
+
+    async def bulk_write(self, ops, ordered=True):
+        self.bulk_calls += 1
+        hits = [op for op in ops if op._filter["_id"] in self.known]
+        matched = sum(isinstance(op, UpdateOne) for op in hits)
+        deleted = sum(isinstance(op, DeleteOne) for op in hits)
+        return BulkResult(matched, deleted)
+
+
+class FakeDB:
+    def __init__(self, known):
+        self.projects = FakeProjects(known)
+
+
+@pytest.fixture
+def known_ids(monkeypatch):
+    ids = [ObjectId(), ObjectId()]
+    monkeypatch.setattr(database, "db", FakeDB(set(ids)))
+    app.dependency_overrides[get_current_admin] = lambda: {"role": "admin"}
+    yield [str(i) for i in ids]
+    app.dependency_overrides.clear()
+
+
+def request(method: str, url: str, **kw) -> httpx.Response:
+    async def go():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, url, **kw)
+
+    return asyncio.run(go())
+
+
+def test_create_returns_millisecond_created_at(known_ids):
+    res = request("POST", "/projects", json={"title": "t", "description": "d", "tech_stack": []})
+    assert res.status_code == 201
+    assert datetime.fromisoformat(res.json()["created_at"]).microsecond % 1000 == 0
+
+
+def test_bulk_applies_all_operations(known_ids):
+    a, b = known_ids
+    res = request("POST", "/projects/bulk", json={"reorder": [b, a], "delete": [a]})
+    assert res.status_code == 200
+    assert res.json() == {"matched": 2, "modified": 2, "deleted": 1}
+
+
+def test_update_returns_document_from_find_one_and_update(known_ids):
+    res = request("PUT", f"/projects/{known_ids[0]}", json={"title": "new", "featured": True})
+    assert res.status_code == 200
+    body = res.json()
+    assert (body["id"], body["title"], body["featured"]) == (known_ids[0], "new", True)
+    assert database.db.projects.updated == {"$set": {"title": "new", "featured": True}}
+
+
+def test_update_unknown_project_is_404(known_ids):
+    res = request("PUT", f"/projects/{ObjectId()}", json={"title": "new"})
+    assert res.status_code == 404
+
+
+def test_bulk_with_unknown_id_is_404_and_writes_nothing(known_ids):
+    unknown = str(ObjectId())
+    res = request("POST", "/projects/bulk", json={"reorder": [known_ids[0], unknown]})
+    assert res.status_code == 404
+    assert unknown in res.json()["detail"]
+    assert database.db.projects.bulk_calls == 0
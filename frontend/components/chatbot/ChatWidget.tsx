@@ -60,7 +60,7 @@ export default function ChatWidget() {
                 body: JSON.stringify({ message: text, chat_history: getHistory() }),
             });
 
-            if (!res.ok) throw new Error('Failed');
+            if (!res.ok) throw new Error(res.status === 503 ? 'busy' : 'Failed');
 
             const reader = res.body!.getReader();
             const decoder = new TextDecoder();
@@ -70,12 +70,14 @@ export default function ChatWidget() {
                 const { done, value } = await reader.read();
                 if (done) break;
                 buffer += decoder.decode(value, { stream: true });
-                const lines = buffer.split('\n');
-                buffer = lines.pop() || '';
-
-                for (const line of lines) {
-                    if (line.startsWith('data: ')) {
-                        const token = line.slice(6);
+                const events = buffer.split('\n\n');
+                buffer = events.pop() || '';
+
+                for (const event of events) {
+                    // Multi-line payloads arrive as one `data:` field per line
+                    const dataLines = event.split('\n').filter((l) => l.startsWith('data: '));
+                    if (dataLines.length) {
+                        const token = dataLines.map((l) => l.slice(6)).join('\n');
                         if (token === '[DONE]') break;
                         setMessages((prev) => {
                             const updated = [...prev];
@@ -88,12 +90,14 @@ export default function ChatWidget() {
                     }
                 }
             }
-        } catch {
+        } catch (err) {
             setMessages((prev) => {
                 const updated = [...prev];
                 updated[updated.length - 1] = {
                     ...updated[updated.length - 1],
-                    content: 'Sorry, I encountered an error. Please try again.',
+                    content: err instanceof Error && err.message === 'busy'
+                        ? "I'm handling a lot of chats right now — please try again in a few seconds."
+                        : 'Sorry, I encountered an error. Please try again.',
                 };
                 return updated;
             });
@@ -23,6 +23,9 @@ export const getProjects = () => api.get("/projects");
 export const createProject = (data: unknown) => api.post("/projects", data);
 export const updateProject = (id: string, data: unknown) => api.put(`/projects/${id}`, data);
 export const deleteProject = (id: string) => api.delete(`/projects/${id}`);
+// Dashboard batch edits in one request (ID check + one bulk write); reorder takes project IDs in display order
+export const bulkProjects = (data: { reorder?: string[]; update?: ({ id: string } & Record<string, unknown>)[]; delete?: string[] }) =>
+    api.post("/projects/bulk", data);
 
 // ── Resume ──────────────────────────────────────────────────────────────────
 export const getResumeInfo = () => api.get("/resume/info");